@@ -1,35 +1,94 @@
+import csv
 import os
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
-import pandas as pd
 import streamlit as st
-from llama_cpp import Llama
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+from llama_cpp import Llama, llama_supports_gpu_offload
 
 
+# ------------------ Question Prompt ------------------ #
+# Static part of the prompt comes first so llama.cpp can reuse its KV cache across calls;
+# only the candidate profile after it has to be prefilled each time.
+QUESTION_PROMPT_PREFIX = """<|system|>
+You are an expert technical interviewer conducting interviews for software engineering positions.
+
+<|user|>
+Generate exactly 5 technical interview questions for the candidate profile given at the end.
+
+Requirements:
+1. Generate EXACTLY 5 questions, numbered 1-5
+2. Each question must be a complete, well-formed technical question
+3. Questions should be relevant to the candidate's tech stack and experience level
+4. Adjust difficulty based on experience level:
+   - 0-1 years: Basic concepts, syntax, simple problem-solving
+   - 2-5 years: Intermediate concepts, optimization, design patterns
+   - 5+ years: System design, scalability, architecture, advanced concepts
+5. Each question must end with a question mark
+6. Focus on practical, job-relevant technical skills
+
+Example format:
+1. What is the difference between let, const, and var in JavaScript?
+2. How would you optimize a slow SQL query?
+3. Explain the concept of dependency injection in software design?
+4. What are the trade-offs between using a microservices vs monolithic architecture?
+5. How would you implement rate limiting in a REST API?
+
+Candidate profile:
+"""
+QUESTION_PROMPT_PROFILE = """- Position: {position}
+- Experience: {exp_bucket} years
+- Tech Stack: {tech_stack}
+
+Now generate 5 questions for this candidate:
+
+<|assistant|>"""
+# llama-cpp-python only honours stop sequences passed as a list (a tuple is silently ignored)
+STOP_STRINGS = ["<|user|>", "<|system|>"]
+
 # ------------------ Load GGUF Model ------------------ #
+MODEL_PATH = os.environ.get("MODEL_PATH", "Phi-3-mini-4k-instruct-q4.gguf")  # e.g. a Q4_0 / IQ3_XXS quant
+N_THREADS = min(16, os.cpu_count() or 8)
+N_GPU_LAYERS = -1 if llama_supports_gpu_offload() else 0  # Offload every layer on CUDA/Metal builds
+
 @st.cache_resource
 def load_model():
-    return Llama(
-        model_path="Phi-3-mini-4k-instruct-q4.gguf",  # update path if needed
+    model = Llama(
+        model_path=MODEL_PATH,
         n_ctx=4096,
-        n_threads=8,
-        n_gpu_layers=20,
-        temperature=0.3,  # Lower temperature for consistent output
-        top_p=0.9
+        n_threads=N_THREADS,
+        n_threads_batch=N_THREADS,
+        n_batch=2048,  # Larger prefill batches for faster time-to-first-token
+        n_gpu_layers=N_GPU_LAYERS,
+        flash_attn=True,  # Fused attention kernel, less KV memory traffic
+        use_mmap=True,  # Let the kernel page weights in on demand
+        use_mlock=False
     )
+    # Warm up on the static prompt prefix: kernel setup and page-in happen at startup,
+    # and the prefix is already in the KV cache for the first question request
+    model(QUESTION_PROMPT_PREFIX, max_tokens=1)
+    return model
 
 llm = load_model()
 
 # ------------------ Validators ------------------ #
+_NAME_RE = re.compile(r"^[A-Za-z ]+$")
+_EMAIL_RE = re.compile(r"^[\w\.-]+@[\w\.-]+\.\w+$")
+_PHONE_RE = re.compile(r"^\d{9}$")  # exactly 9 digits
+# Numbered question line: at least 10 characters, ending with a question mark
+_Q_RE = re.compile(r'^[ \t]*\d+\.[ \t]*(.{9,}\?)[ \t\r]*$', re.M)
+
 def valid_name(name): 
-    return bool(re.match(r"^[A-Za-z ]+$", name)) and len(name.strip()) > 1
+    return bool(_NAME_RE.match(name)) and len(name.strip()) > 1
 
 def valid_email(email): 
-    return bool(re.match(r"^[\w\.-]+@[\w\.-]+\.\w+$", email))
+    return bool(_EMAIL_RE.match(email))
 
 def valid_phone(phone): 
-    return bool(re.match(r"^\d{9}$", phone))  # exactly 9 digits
+    return bool(_PHONE_RE.match(phone))
 
 def valid_experience(exp):
     try:
@@ -38,49 +97,85 @@ def valid_experience(exp):
     except:
         return False
 
-# ------------------ Question Quality Validator ------------------ #
-def is_valid_question(question):
-    """Check if a question is technically valid and meaningful"""
-    if len(question.strip()) < 10:
-        return False
-    if not question.strip().endswith('?'):
-        return False
-    words = question.strip().split()
-    if len(words) < 4:
-        return False
-    return True
-
-# ------------------ Excel Export ------------------ #
-def append_to_excel():
-    """Append candidate data + Q&A into interview_database.xlsx (single sheet)."""
-    filename = "interview_database.xlsx"
-
+# ------------------ Onboarding Steps ------------------ #
+# (field, validator or None for free text, parser, success message, error message)
+ONBOARDING_STEPS = [
+    ("Full Name", valid_name, str, "Great! What's your email?",
+     "❌ Invalid name. Please enter again (letters and spaces only)."),
+    ("Email", valid_email, str, "Got it ✅. Please share your phone number (9 digits).",
+     "❌ Invalid email format. Try again."),
+    ("Phone", valid_phone, str, "Thanks! How many years of experience do you have?",
+     "❌ Invalid phone number. Must be 9 digits."),
+    ("Experience", valid_experience, int, "Perfect. What position are you applying for?",
+     "❌ Enter a valid number between 0 and 50."),
+    ("Desired Position", None, str, "Nice! Please list your tech stack (comma-separated).", None),
+    ("Tech Stack", None, str, "Great! Finally, where are you currently located?", None),
+]
+
+# ------------------ Interview Database ------------------ #
+CSV_FILENAME = "interview_database.csv"
+XLSX_FILENAME = "interview_database.xlsx"
+ENABLE_EXCEL_EXPORT = os.environ.get("ENABLE_EXCEL_EXPORT") == "1"
+CANDIDATE_COLUMNS = ["Full Name", "Email", "Phone", "Experience", "Desired Position", "Location", "Tech Stack"]
+
+def append_interview_record():
+    """Append candidate data + Q&A as one row of interview_database.csv (append-only)."""
     # Flatten Q&A into one row
     qa_pairs = {}
     for i, (q, a) in enumerate(zip(st.session_state.questions, st.session_state.answers)):
         qa_pairs[f"Q{i+1}"] = q
         qa_pairs[f"A{i+1}"] = a
 
-    # Candidate + metadata
+    # Candidate + metadata (date and time taken from one clock read)
+    now = datetime.now()
     record = {
-        **st.session_state.candidate,
+        **{field: st.session_state.candidate[field] for field in CANDIDATE_COLUMNS},
         **qa_pairs,
-        "Interview_Date": datetime.now().strftime("%Y-%m-%d"),
-        "Interview_Time": datetime.now().strftime("%H:%M:%S"),
+        "Interview_Date": now.strftime("%Y-%m-%d"),
+        "Interview_Time": now.strftime("%H:%M:%S"),
     }
 
-    new_df = pd.DataFrame([record])
+    if not os.path.exists(CSV_FILENAME) and os.path.exists(XLSX_FILENAME):
+        _import_legacy_xlsx()
+
+    with open(CSV_FILENAME, "a", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=list(record.keys()))
+        if f.tell() == 0:
+            writer.writeheader()
+        writer.writerow(record)
 
-    if os.path.exists(filename):
-        # Open in append mode safely
-        with pd.ExcelWriter(filename, engine="openpyxl", mode="a", if_sheet_exists="overlay") as writer:
-            existing = pd.read_excel(filename, sheet_name="All_Candidates")
-            updated = pd.concat([existing, new_df], ignore_index=True)
-            updated.to_excel(writer, sheet_name="All_Candidates", index=False)
-    else:
-        new_df.to_excel(filename, sheet_name="All_Candidates", index=False)
+def _import_legacy_xlsx():
+    """Seed the CSV with the rows of an interview_database.xlsx written before the CSV store"""
+    from openpyxl import load_workbook  # Imported lazily: only needed once per deployment
 
-    return filename
+    wb = load_workbook(XLSX_FILENAME, read_only=True)
+    try:
+        with open(CSV_FILENAME, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            for row in wb["All_Candidates"].iter_rows(values_only=True):
+                writer.writerow(["" if v is None else v for v in row])
+    finally:
+        wb.close()
+
+def export_to_xlsx():
+    """Build interview_database.xlsx (single sheet) from the CSV history on demand."""
+    from openpyxl import Workbook  # Imported lazily: only needed when exporting
+
+    # Write-only workbook streams rows straight from the CSV with near-constant memory
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("All_Candidates")
+    with open(CSV_FILENAME, newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        ws.append(header)
+        # CSV cells are all text; keep Experience numeric as it was in the original workbook
+        exp_idx = header.index("Experience")
+        for row in reader:
+            if row[exp_idx].isdigit():
+                row[exp_idx] = int(row[exp_idx])
+            ws.append(row)
+    wb.save(XLSX_FILENAME)
+    return XLSX_FILENAME
 
 
 # ------------------ Session State ------------------ #
@@ -102,62 +197,93 @@ def add_message(role, content):
     st.session_state.messages.append({"role": role, "content": content})
 
 # ------------------ Generate Interview Questions ------------------ #
-def generate_interview_questions(position, experience, tech_stack):
-    prompt = f"""<|system|>
-You are an expert technical interviewer conducting interviews for software engineering positions.
+@st.cache_resource
+def get_executor():
+    """Single worker shared by all sessions, so only one llama call is in flight per process"""
+    return ThreadPoolExecutor(max_workers=1)
+
+def experience_bucket(years):
+    """Map years of experience onto the difficulty tiers used in the prompt"""
+    if years <= 1:
+        return "0-1"
+    if years <= 5:
+        return "2-5"
+    return "5+"
+
+def parse_questions(text):
+    return [q.strip() for q in _Q_RE.findall(text) if len(q.split()) >= 4]
+
+def generate_fallback_questions(position, exp_bucket, tech_stack):
+    """Template questions used when the model does not return 5 usable ones"""
+    techs = [t.strip() for t in tech_stack.split(",") if t.strip()]
+    stack = ", ".join(techs) or "your tech stack"
+    primary = techs[0] if techs else "your primary language"
+    tier_question = {
+        "0-1": f"Which basic data structures do you use most in {primary} and why?",
+        "2-5": f"How would you find and fix a performance problem in an application built with {primary}?",
+        "5+": f"How would you design a scalable, fault-tolerant system using {stack}?",
+    }[exp_bucket]
+    return [
+        f"What features of {primary} do you rely on most in your work as a {position}?",
+        f"How do you test and debug code written with {stack}?",
+        tier_question,
+        "How do you handle errors and unexpected input in your projects?",
+        f"What is a difficult technical problem you solved as a {position}, and how did you approach it?",
+    ]
+
+@st.cache_data(show_spinner=False)
+def _cached_questions(position_key, exp_bucket, stack_key, _position, _tech_stack):
+    """Generate questions once per (position, experience tier, tech stack) profile.
+
+    Only the normalized *_key arguments form the cache key; the underscore-prefixed
+    ones are unhashed and keep the candidate's own wording for the prompt.
+    """
+    position = _position
+    tech_stack = ", ".join(s.strip() for s in _tech_stack.split(",") if s.strip())
+    prompt = QUESTION_PROMPT_PREFIX + QUESTION_PROMPT_PROFILE.format(
+        position=position, exp_bucket=exp_bucket, tech_stack=tech_stack
+    )
 
-<|user|>
-Generate exactly 5 technical interview questions for a candidate with the following profile:
-- Position: {position}
-- Experience: {experience} years
-- Tech Stack: {tech_stack}
+    # Stream tokens and stop decoding as soon as 5 numbered questions are complete
+    raw_text = ""
+    for chunk in llm(
+        prompt,
+        max_tokens=800,
+        temperature=0.0,  # Greedy decoding: identical profiles get identical questions
+        top_k=1,
+        top_p=1.0,
+        repeat_penalty=1.0,
+        stop=STOP_STRINGS,
+        stream=True
+    ):
+        text = chunk["choices"][0]["text"]
+        raw_text += text
+        # Only count finished lines, with the same filter as the final parse
+        if "\n" in text and len(parse_questions(raw_text[:raw_text.rfind("\n")])) >= 5:
+            break
+    questions = parse_questions(raw_text)
+
+    if len(questions) < 5:
+        questions = generate_fallback_questions(position, exp_bucket, _tech_stack)
+
+    return questions[:5]
 
-Requirements:
-1. Generate EXACTLY 5 questions, numbered 1-5
-2. Each question must be a complete, well-formed technical question
-3. Questions should be relevant to the candidate's tech stack and experience level
-4. Adjust difficulty based on experience level:
-   - 0-1 years: Basic concepts, syntax, simple problem-solving
-   - 2-5 years: Intermediate concepts, optimization, design patterns
-   - 5+ years: System design, scalability, architecture, advanced concepts
-5. Each question must end with a question mark
-6. Focus on practical, job-relevant technical skills
-
-Example format:
-1. What is the difference between let, const, and var in JavaScript?
-2. How would you optimize a slow SQL query?
-3. Explain the concept of dependency injection in software design?
-4. What are the trade-offs between using a microservices vs monolithic architecture?
-5. How would you implement rate limiting in a REST API?
+def generate_interview_questions(position, experience, tech_stack):
+    """Start generating questions in the background and return the Future"""
+    stack_key = tuple(sorted(s.strip().lower() for s in tech_stack.split(',') if s.strip()))
+    args = (position.strip().lower(), experience_bucket(experience), stack_key, position.strip(), tech_stack)
+    ctx = get_script_run_ctx()
 
-Now generate 5 questions for this candidate:
+    def run():
+        # st.cache_data needs the session's script context on the worker thread
+        add_script_run_ctx(threading.current_thread(), ctx)
+        return _cached_questions(*args)
 
-<|assistant|>"""
+    return get_executor().submit(run)
 
+def wait_for_questions(future):
     try:
-        response = llm(
-            prompt,
-            max_tokens=800,
-            temperature=0.3,
-            top_p=0.9,
-            stop=["<|user|>", "<|system|>"]
-        )
-        raw_text = response["choices"][0]["text"].strip()
-        lines = raw_text.split('\n')
-        questions = []
-
-        for line in lines:
-            line = line.strip()
-            if re.match(r'^\d+\.', line):
-                question = re.sub(r'^\d+\.\s*', '', line).strip()
-                if is_valid_question(question):
-                    questions.append(question)
-
-        if len(questions) < 5:
-            questions = generate_fallback_questions(position, experience, tech_stack)
-
-        return questions[:5]
-
+        return future.result()
     except Exception as e:
         st.error(f"Error generating questions: {e}")
 
@@ -165,116 +291,138 @@ Now generate 5 questions for this candidate:
 if not st.session_state.messages:
     add_message("assistant", "Hello 👋, welcome to your technical interview! What's your full name?")
 
-# ------------------ Show chat history ------------------ #
-for msg in st.session_state.messages:
-    with st.chat_message(msg["role"]):
-        st.markdown(msg["content"])
-
-# ------------------ Chat input ------------------ #
-user_input = st.chat_input("Type your response...")
+# ------------------ Sidebar with candidate info ------------------ #
+# Placeholder created by the full script run; the chat fragment redraws it in place,
+# so a turn never needs a full rerun just to refresh the sidebar
+sidebar_info = st.sidebar.empty()
+
+def show_sidebar_info():
+    if not st.session_state.candidate:
+        return
+    with sidebar_info.container():
+        st.subheader("👤 Candidate Info")
+        for key, value in st.session_state.candidate.items():
+            st.write(f"**{key}:** {value}")
 
-if user_input:
-    add_message("user", user_input)
+        if st.session_state.questions:
+            st.subheader("📝 Interview Progress")
+            st.progress(st.session_state.q_index / len(st.session_state.questions))
+            st.write(f"Question {st.session_state.q_index}/{len(st.session_state.questions)}")
 
-    # Candidate onboarding
-    if "Full Name" not in st.session_state.candidate:
-        if valid_name(user_input):
-            st.session_state.candidate["Full Name"] = user_input
-            add_message("assistant", "Great! What's your email?")
+# ------------------ Chat panel ------------------ #
+def show_messages(messages):
+    for msg in messages:
+        with st.chat_message(msg["role"]):
+            st.markdown(msg["content"])
+
+@st.fragment
+def chat_panel():
+    """Chat history, input and interview state machine; reruns on its own on each submit"""
+    # ------------------ Show chat history ------------------ #
+    # Container keeps this turn's messages above the chat input
+    history = st.container()
+    with history:
+        show_messages(st.session_state.messages)
+
+    # ------------------ Chat input ------------------ #
+    user_input = st.chat_input("Type your response...")
+
+    if user_input:
+        n_shown = len(st.session_state.messages)
+        add_message("user", user_input)
+
+        # Candidate onboarding: the number of collected fields indexes the current step
+        step_idx = len(st.session_state.candidate)
+        if step_idx < len(ONBOARDING_STEPS):
+            field, validator, parse, success_msg, error_msg = ONBOARDING_STEPS[step_idx]
+            if validator is None or validator(user_input):
+                st.session_state.candidate[field] = parse(user_input)
+                add_message("assistant", success_msg)
+                if field == "Tech Stack":
+                    # Generate questions while the candidate answers the location step
+                    st.session_state.qfuture = generate_interview_questions(
+                        st.session_state.candidate["Desired Position"],
+                        st.session_state.candidate["Experience"],
+                        user_input
+                    )
+            else:
+                add_message("assistant", error_msg)
+
+        elif step_idx == len(ONBOARDING_STEPS):  # Location is last; questions are already generating
+            st.session_state.candidate["Location"] = user_input
+
+            with st.spinner("Generating your personalized interview questions..."):
+                questions = wait_for_questions(st.session_state.qfuture)
+                if not questions:
+                    candidate = st.session_state.candidate
+                    questions = generate_fallback_questions(
+                        candidate["Desired Position"].strip(),
+                        experience_bucket(candidate["Experience"]),
+                        candidate["Tech Stack"]
+                    )
+                st.session_state.questions = questions
+                st.session_state.q_index = 0
+
+            add_message("assistant", "Thanks for the details! Let's start your technical interview.")
+            add_message("assistant", f"**Question 1:** {st.session_state.questions[0]}")
+
+        # ------------------ Conduct Interview ------------------ #
         else:
-            add_message("assistant", "❌ Invalid name. Please enter again (letters and spaces only).")
+            idx = st.session_state.q_index
+            if idx < len(st.session_state.questions):
+                st.session_state.answers.append(user_input)
+                st.session_state.q_index += 1
 
-    elif "Email" not in st.session_state.candidate:
-        if valid_email(user_input):
-            st.session_state.candidate["Email"] = user_input
-            add_message("assistant", "Got it ✅. Please share your phone number (9 digits).")
-        else:
-            add_message("assistant", "❌ Invalid email format. Try again.")
+                if st.session_state.q_index < len(st.session_state.questions):
+                    next_q = st.session_state.q_index + 1
+                    add_message("assistant", f"**Question {next_q}:** {st.session_state.questions[st.session_state.q_index]}")
+                else:
+                    add_message("assistant", "✅ That concludes the interview. Thank you for your time!")
 
-    elif "Phone" not in st.session_state.candidate:
-        if valid_phone(user_input):
-            st.session_state.candidate["Phone"] = user_input
-            add_message("assistant", "Thanks! How many years of experience do you have?")
-        else:
-            add_message("assistant", "❌ Invalid phone number. Must be 9 digits.")
+                    # Candidate summary
+                    summary = "### 📋 Interview Summary\n\n"
+                    summary += "**Candidate Information:**\n"
+                    for k, v in st.session_state.candidate.items():
+                        summary += f"- **{k}:** {v}\n"
 
-    elif "Experience" not in st.session_state.candidate:
-        if valid_experience(user_input):
-            st.session_state.candidate["Experience"] = int(user_input)
-            add_message("assistant", "Perfect. What position are you applying for?")
-        else:
-            add_message("assistant", "❌ Enter a valid number between 0 and 50.")
-
-    elif "Desired Position" not in st.session_state.candidate:
-        st.session_state.candidate["Desired Position"] = user_input
-        add_message("assistant", "Nice! Where are you currently located?")
-
-    elif "Location" not in st.session_state.candidate:
-        st.session_state.candidate["Location"] = user_input
-        add_message("assistant", "Great! Finally, please list your tech stack (comma-separated).")
-
-    elif "Tech Stack" not in st.session_state.candidate:
-        st.session_state.candidate["Tech Stack"] = user_input
-
-        with st.spinner("Generating your personalized interview questions..."):
-            questions = generate_interview_questions(
-                st.session_state.candidate["Desired Position"],
-                st.session_state.candidate["Experience"],
-                user_input
-            )
-            st.session_state.questions = questions
-            st.session_state.q_index = 0
-
-        add_message("assistant", "Thanks for the details! Let's start your technical interview.")
-        add_message("assistant", f"**Question 1:** {st.session_state.questions[0]}")
-
-    # ------------------ Conduct Interview ------------------ #
-    else:
-        idx = st.session_state.q_index
-        if idx < len(st.session_state.questions):
-            st.session_state.answers.append(user_input)
-            st.session_state.q_index += 1
-
-            if st.session_state.q_index < len(st.session_state.questions):
-                next_q = st.session_state.q_index + 1
-                add_message("assistant", f"**Question {next_q}:** {st.session_state.questions[st.session_state.q_index]}")
-            else:
-                add_message("assistant", "✅ That concludes the interview. Thank you for your time!")
+                    summary += "\n**Interview Q&A:**\n"
+                    for i, (q, a) in enumerate(zip(st.session_state.questions, st.session_state.answers)):
+                        summary += f"\n**Q{i+1}:** {q}\n"
+                        summary += f"**Answer:** {a}\n"
 
-                # Candidate summary
-                summary = "### 📋 Interview Summary\n\n"
-                summary += "**Candidate Information:**\n"
-                for k, v in st.session_state.candidate.items():
-                    summary += f"- **{k}:** {v}\n"
+                    add_message("assistant", summary)
 
-                summary += "\n**Interview Q&A:**\n"
-                for i, (q, a) in enumerate(zip(st.session_state.questions, st.session_state.answers)):
-                    summary += f"\n**Q{i+1}:** {q}\n"
-                    summary += f"**Answer:** {a}\n"
+                    # Save results to the interview database
+                    append_interview_record()
 
-                add_message("assistant", summary)
+        # Draw only this turn's new messages and refresh the sidebar in place, no rerun
+        with history:
+            show_messages(st.session_state.messages[n_shown:])
+        show_sidebar_info()
 
-                # Save results to Excel
-                filename = append_to_excel()
-                
+chat_panel()
 
-    st.rerun()
+show_sidebar_info()
 
-# ------------------ Sidebar with candidate info ------------------ #
-if st.session_state.candidate:
+# ------------------ Excel download (operators only) ------------------ #
+# The export contains every candidate's personal data, so it is hidden unless the operator opts in
+if ENABLE_EXCEL_EXPORT and os.path.exists(CSV_FILENAME):
     with st.sidebar:
-        st.subheader("👤 Candidate Info")
-        for key, value in st.session_state.candidate.items():
-            st.write(f"**{key}:** {value}")
-
-        if st.session_state.questions:
-            st.subheader("📝 Interview Progress")
-            st.progress(st.session_state.q_index / len(st.session_state.questions))
-            st.write(f"Question {st.session_state.q_index}/{len(st.session_state.questions)}")
+        st.subheader("📁 Interview Database")
+        if st.button("Export to Excel"):
+            with open(export_to_xlsx(), "rb") as f:
+                st.download_button(
+                    "Download interview_database.xlsx",
+                    data=f.read(),
+                    file_name=XLSX_FILENAME,
+                    mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+                )
 
 # ------------------ Debug info ------------------ #
-if st.checkbox("Show Debug Info"):
-    st.json({
+# Lives in the sidebar: the fragment's chat input is inline, so anything drawn
+# in the main area after it would appear below the input
+if st.sidebar.checkbox("Show Debug Info"):
+    st.sidebar.json({
         "candidate": st.session_state.candidate,
         "questions": st.session_state.questions,
         "answers": st.session_state.answers,